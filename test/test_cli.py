@@ -9,30 +9,336 @@ Provides server management capabilities and will be extended to support client t
 """
 
 import argparse
+import concurrent.futures
+import functools
 import os
+import re
+import signal
+import socket
+import struct
 import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, FrozenSet, Optional
 
-import psutil
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
+# Project layout, resolved once at import
+TEST_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = TEST_DIR.parent
+SERVER_DIR = PROJECT_ROOT / "server"
+LOGS_DIR = TEST_DIR / "logs"
+CONFIGS_DIR = TEST_DIR / "configs"
+KEYS_DIR = TEST_DIR / "keys"
+
+# TCP state code for LISTEN in /proc/net/tcp{,6}
+TCP_LISTEN_HEX = "0A"
+
+# Paths (relative to the project root) whose changes make the built server stale
+SERVER_SOURCES = (
+    "server/src",
+    "server/Cargo.toml",
+    "server/Cargo.lock",
+    "secure_chat/src",
+    "secure_chat/Cargo.toml",
+)
+
+# Package name in a Cargo manifest's [package] table
+PACKAGE_NAME_RE = re.compile(r'^\[package\][^\[]*?^name\s*=\s*"([^"]+)"', re.M | re.S)
+
+# Matches the port of an entry in a server config's bootstrap_servers list
+BOOTSTRAP_PORT_RE = re.compile(r"^\s+-?\s*port:\s*(\d+)", re.M)
+
+# Seconds to wait for a server to exit after SIGTERM before sending SIGKILL
+STOP_TIMEOUT = 5.0
+
+# Interval between liveness checks while waiting for a server to exit (seconds)
+STOP_POLL_INTERVAL = 0.05
+
+# Seconds to wait for a background server to start listening
+SERVER_START_TIMEOUT = 10.0
+
+# Port polling backoff while waiting for a server to listen (seconds)
+LISTEN_POLL_INITIAL = 0.05
+LISTEN_POLL_MAX = 0.5
+
+# Netlink sock_diag constants (linux/sock_diag.h, linux/inet_diag.h)
+NETLINK_INET_DIAG = 4
+SOCK_DIAG_BY_FAMILY = 20
+NLM_F_REQUEST = 0x1
+NLM_F_DUMP = 0x300
+NLMSG_ERROR = 0x2
+NLMSG_DONE = 0x3
+TCP_LISTEN = 10
+
+# How long a snapshot of listening ports stays valid (seconds)
+PORTS_CACHE_TTL = 0.2
+
+# How long a psutil connection snapshot stays valid (seconds)
+CONN_SNAPSHOT_TTL = 0.5
+
+
+# Maximum bytes read from a server's output pipe per read() call
+STREAM_CHUNK_SIZE = 65536
+
+# Matches the readlink target of a socket file descriptor
+SOCKET_INODE_RE = re.compile(r"socket:\[(\d+)\]")
+
+
+def _iter_listen_sockets_linux():
+    """Yield (port, inode) for each LISTEN socket in /proc/net/tcp{,6}."""
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(table) as f:
+                next(f, None)  # Skip header
+                for line in f:
+                    fields = line.split()
+                    if len(fields) > 9 and fields[3] == TCP_LISTEN_HEX:
+                        yield int(fields[1].rsplit(":", 1)[1], 16), int(fields[9])
+        except OSError:
+            pass
+
+
+def _listening_ports_linux() -> FrozenSet[int]:
+    """Read listening TCP ports directly from /proc/net/tcp and /proc/net/tcp6."""
+    return frozenset(port for port, _ in _iter_listen_sockets_linux())
+
+
+def _scan_proc_fds() -> Dict[int, int]:
+    """Map socket inodes to the PID holding them by walking /proc/*/fd."""
+    owners = {}
+    with os.scandir("/proc") as procs:
+        for proc in procs:
+            if not proc.name.isdigit():
+                continue
+            fd_dir = f"/proc/{proc.name}/fd"
+            try:
+                with os.scandir(fd_dir) as fds:
+                    for fd in fds:
+                        try:
+                            match = SOCKET_INODE_RE.match(os.readlink(fd.path))
+                        except OSError:
+                            continue
+                        if match:
+                            owners[int(match.group(1))] = int(proc.name)
+            except OSError:
+                continue
+    return owners
+
+
+def _listening_ports_netlink() -> FrozenSet[int]:
+    """Dump listening TCP ports with a single INET_DIAG request per family.
+
+    The kernel filters by socket state, so only LISTEN sockets are returned.
+    Raises OSError if netlink sock_diag is unavailable.
+    """
+    ports = set()
+    with socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_INET_DIAG) as sock:
+        for seq, family in enumerate((socket.AF_INET, socket.AF_INET6), start=1):
+            # inet_diag_req_v2: family, protocol, ext, pad, states, inet_diag_sockid
+            req = struct.pack(
+                "=BBBxI48x", family, socket.IPPROTO_TCP, 0, 1 << TCP_LISTEN
+            )
+            # nlmsghdr: len, type, flags, seq, pid
+            hdr = struct.pack(
+                "=IHHII",
+                16 + len(req),
+                SOCK_DIAG_BY_FAMILY,
+                NLM_F_REQUEST | NLM_F_DUMP,
+                seq,
+                0,
+            )
+            sock.send(hdr + req)
+
+            done = False
+            while not done:
+                data = sock.recv(65536)
+                offset = 0
+                while offset + 16 <= len(data):
+                    length, msg_type = struct.unpack_from("=IH", data, offset)
+                    if length < 16 or msg_type == NLMSG_DONE:
+                        done = True
+                        break
+                    if msg_type == NLMSG_ERROR:
+                        raise OSError("INET_DIAG request failed")
+                    # inet_diag_msg: family, state, timer, retrans, then sport (BE)
+                    (sport,) = struct.unpack_from("!H", data, offset + 20)
+                    ports.add(sport)
+                    offset += (length + 3) & ~3
+    return frozenset(ports)
+
+
+def _iter_server_pids(server_bin: Path):
+    """Yield PIDs of `cargo run` and server binary processes by scanning /proc.
+
+    Only /proc/<pid>/comm is read for most processes; cmdline or exe is read
+    only for processes named cargo or after the server binary.
+    """
+    # comm holds at most the first 15 bytes of the executable name
+    server_comm = os.fsencode(server_bin.name)[:15]
+    server_exe = str(server_bin)
+
+    with os.scandir("/proc") as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry.name}/comm", "rb") as f:
+                    comm = f.read().strip()
+                if comm == b"cargo":
+                    with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                        matched = b"run" in f.read().split(b"\0")
+                elif comm == server_comm:
+                    exe = os.readlink(f"/proc/{entry.name}/exe")
+                    matched = exe.removesuffix(" (deleted)") == server_exe
+                else:
+                    continue
+            except OSError:
+                continue
+            if matched:
+                yield int(entry.name)
+
+
+def _bootstrap_ports(config_path: str) -> FrozenSet[int]:
+    """Read the ports a server bootstraps from out of its YAML config."""
+    with open(config_path) as f:
+        text = f.read()
+    if re.search(r"^skip_bootstrap:\s*true\b", text, re.M):
+        return frozenset()
+
+    # Only look at the indented entries directly under bootstrap_servers
+    section = re.search(r"^bootstrap_servers:.*?(?=^\S|\Z)", text, re.M | re.S)
+    if not section:
+        return frozenset()
+    return frozenset(int(port) for port in BOOTSTRAP_PORT_RE.findall(section.group()))
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_logs_dir() -> None:
+    """Create the logs directory, at most once per process."""
+    LOGS_DIR.mkdir(exist_ok=True)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process exists by sending it signal 0."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # The process exists but belongs to another user
+        return True
+    return True
+
+
+def _terminate(pid: int, timeout: float = STOP_TIMEOUT) -> None:
+    """Send SIGTERM to a process and SIGKILL it if it has not exited in time.
+
+    Raises ProcessLookupError if the process does not exist.
+    """
+    os.kill(pid, signal.SIGTERM)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return
+        time.sleep(STOP_POLL_INTERVAL)
+
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def _tail(path: Path, n: int) -> str:
+    """Return the last n lines of a file by reading backwards from the end."""
+    if n <= 0:
+        return ""
+
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        block = min(size, n * 200)
+        while True:
+            f.seek(size - block)
+            data = f.read(block)
+            # Stop once we have more than n line breaks or hit the start of the file
+            if block == size or data.count(b"\n") > n:
+                break
+            block = min(size, block * 2)
+    return b"\n".join(data.splitlines()[-n:]).decode("utf-8", "replace")
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to fd, retrying on short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _stream_output(pipe, log) -> None:
+    """Copy a subprocess pipe to stdout and a log file (opened "w+b") until EOF.
+
+    On Linux the output is spliced from the pipe into the log file and then
+    sent from the log file to stdout, so it never passes through userspace.
+    Falls back to os.read/os.write elsewhere or if the kernel rejects either call.
+    """
+    pipe_fd = pipe.fileno()
+    log_fd = log.fileno()
+    out_fd = sys.stdout.fileno()
+    sys.stdout.flush()
+
+    use_splice = hasattr(os, "splice")
+    use_sendfile = use_splice
+    offset = os.lseek(log_fd, 0, os.SEEK_CUR)
+
+    while True:
+        if use_splice:
+            try:
+                n = os.splice(pipe_fd, log_fd, STREAM_CHUNK_SIZE)
+            except OSError:
+                use_splice = False
+                continue
+            if not n:
+                break
+
+            # Echo the new part of the log file to stdout
+            sent = 0
+            while use_sendfile and sent < n:
+                try:
+                    sent += os.sendfile(out_fd, log_fd, offset + sent, n - sent)
+                except OSError:
+                    use_sendfile = False
+            if sent < n:
+                _write_all(out_fd, os.pread(log_fd, n - sent, offset + sent))
+            offset += n
+        else:
+            chunk = os.read(pipe_fd, STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            _write_all(log_fd, chunk)
+            _write_all(out_fd, chunk)
+
+
+class PlainConsole:
+    """Minimal stand-in for rich's Console that prints unstyled text."""
+
+    def print(self, *objects, style: Optional[str] = None, **kwargs):
+        print(*objects, **kwargs)
 
 
 class TestManager:
     """Manages testing for the secure chat protocol (servers and clients)."""
 
-    def __init__(self):
-        self.console = Console()
-        self.test_dir = Path(__file__).parent
-        self.project_root = self.test_dir.parent
-        self.server_dir = self.project_root / "server"
-        self.logs_dir = self.test_dir / "logs"
-        self.configs_dir = self.test_dir / "configs"
-        self.keys_dir = self.test_dir / "keys"
+    def __init__(self, plain: bool = False):
+        self.plain = plain
+        self._console = None
+        self.test_dir = TEST_DIR
+        self.project_root = PROJECT_ROOT
+        self.server_dir = SERVER_DIR
+        self.logs_dir = LOGS_DIR
+        self.configs_dir = CONFIGS_DIR
+        self.keys_dir = KEYS_DIR
 
         # Server configurations
         self.servers = {
@@ -53,8 +359,40 @@ class TestManager:
             },
         }
 
+        # Resolve per-server file paths once
+        for server_num, config in self.servers.items():
+            config["pid_file"] = self.logs_dir / f"server{server_num}.pid"
+            config["log_file"] = self.logs_dir / f"server{server_num}.log"
+            config["config_path"] = str(self.configs_dir / config["config"])
+            config["key_path"] = str(
+                self.keys_dir / f"server{server_num}_private_key.pem"
+            )
+
+        # Built server binary and whether it is up to date, resolved on first launch
+        self._server_bin = None
+        self._server_bin_fresh = None
+
+        # (timestamp, ports) snapshot used by is_port_in_use
+        self._ports_cache = None
+        # (timestamp, {port: pid}) snapshot of psutil listening connections
+        self._conn_snapshot = None
+        # (timestamp, {port: pid}) snapshot built from /proc socket inodes
+        self._port_owners = None
+
         # Ensure directories exist
-        self.logs_dir.mkdir(exist_ok=True)
+        _ensure_logs_dir()
+
+    @property
+    def console(self):
+        """Output console, created on first use so plain mode never imports rich."""
+        if self._console is None:
+            if self.plain:
+                self._console = PlainConsole()
+            else:
+                from rich.console import Console
+
+                self._console = Console()
+        return self._console
 
     def build_server(self) -> bool:
         """Build the server binary."""
@@ -70,6 +408,7 @@ class TestManager:
             )
 
             if result.returncode == 0:
+                self._server_bin_fresh = None
                 self.console.print("Server built successfully", style="green")
                 return True
             else:
@@ -83,33 +422,147 @@ class TestManager:
             self.console.print(f"Build error: {e}", style="red")
             return False
 
+    def _snapshot_conns(self) -> Dict[int, Optional[int]]:
+        """Map listening TCP ports to their owning PIDs using psutil, cached briefly."""
+        now = time.monotonic()
+        if self._conn_snapshot and now - self._conn_snapshot[0] < CONN_SNAPSHOT_TTL:
+            return self._conn_snapshot[1]
+
+        import psutil
+
+        conns = {
+            conn.laddr.port: conn.pid
+            for conn in psutil.net_connections(kind="tcp")
+            if conn.status == psutil.CONN_LISTEN
+        }
+        self._conn_snapshot = (now, conns)
+        return conns
+
+    def _port_owner(self) -> Dict[int, int]:
+        """Map each listening TCP port to the PID that owns its socket (Linux only).
+
+        The map is built from one walk of /proc/*/fd and cached briefly, so
+        stopping several servers by port shares a single scan.
+        """
+        now = time.monotonic()
+        if self._port_owners and now - self._port_owners[0] < CONN_SNAPSHOT_TTL:
+            return self._port_owners[1]
+
+        owners = _scan_proc_fds()
+        port_owners = {
+            port: owners[inode]
+            for port, inode in _iter_listen_sockets_linux()
+            if inode in owners
+        }
+        self._port_owners = (now, port_owners)
+        return port_owners
+
+    def _listening_ports(self) -> FrozenSet[int]:
+        """Get the set of listening TCP ports, cached for a short time."""
+        now = time.monotonic()
+        if self._ports_cache and now - self._ports_cache[0] < PORTS_CACHE_TTL:
+            return self._ports_cache[1]
+
+        if sys.platform == "linux":
+            try:
+                ports = _listening_ports_netlink()
+            except OSError:
+                ports = _listening_ports_linux()
+        else:
+            ports = frozenset(self._snapshot_conns())
+
+        self._ports_cache = (now, ports)
+        return ports
+
+    def _get_listen_ports(self) -> FrozenSet[int]:
+        """Take a fresh snapshot of all listening TCP ports."""
+        self._ports_cache = None
+        self._conn_snapshot = None
+        self._port_owners = None
+        return self._listening_ports()
+
+    def _resolve_server_bin(self) -> Path:
+        """Locate the server debug binary from its Cargo manifest."""
+        name = "server"
+        try:
+            match = PACKAGE_NAME_RE.search((self.server_dir / "Cargo.toml").read_text())
+            if match:
+                name = match.group(1)
+        except OSError:
+            pass
+
+        # An absolute CARGO_TARGET_DIR replaces server_dir when joined
+        target_dir = Path(os.environ.get("CARGO_TARGET_DIR", "target"))
+        return self.server_dir / target_dir / "debug" / name
+
+    def _get_server_bin(self) -> Path:
+        """Return the server binary path, resolving it on first use."""
+        if self._server_bin is None:
+            self._server_bin = self._resolve_server_bin()
+        return self._server_bin
+
+    def _server_bin_is_fresh(self, binary: Path) -> bool:
+        """Check that the binary exists and is newer than all server sources."""
+        try:
+            built = binary.stat().st_mtime
+        except OSError:
+            return False
+
+        for source in SERVER_SOURCES:
+            path = self.project_root / source
+            if path.is_file():
+                if path.stat().st_mtime > built:
+                    return False
+                continue
+            for root, _, files in os.walk(path):
+                for name in files:
+                    # lstat so dangling symlinks (e.g. editor lock files) don't fail
+                    try:
+                        mtime = os.lstat(os.path.join(root, name)).st_mtime
+                    except OSError:
+                        continue
+                    if mtime > built:
+                        return False
+        return True
+
+    def _server_command(self) -> list:
+        """Command that starts a server: the built binary if fresh, else cargo run."""
+        server_bin = self._get_server_bin()
+        if self._server_bin_fresh is None:
+            self._server_bin_fresh = self._server_bin_is_fresh(server_bin)
+        if self._server_bin_fresh:
+            return [str(server_bin)]
+        return ["cargo", "run"]
+
     def is_port_in_use(self, port: int) -> bool:
         """Check if a port is in use."""
-        for conn in psutil.net_connections():
-            if conn.laddr.port == port and conn.status == psutil.CONN_LISTEN:
-                return True
-        return False
+        return port in self._listening_ports()
+
+    def _read_pid_file(self, server_num: int) -> Optional[int]:
+        """Read the saved PID of a server, without checking that it is alive."""
+        try:
+            with open(self.servers[server_num]["pid_file"], "rb") as f:
+                return int(f.read())
+        except (ValueError, OSError):
+            return None
 
     def get_server_pid(self, server_num: int) -> Optional[int]:
         """Get the PID of a running server."""
-        pid_file = self.logs_dir / f"server{server_num}.pid"
-        if pid_file.exists():
-            try:
-                pid = int(pid_file.read_text().strip())
-                if psutil.pid_exists(pid):
-                    return pid
-            except (ValueError, OSError):
-                pass
+        pid = self._read_pid_file(server_num)
+        if pid is not None and _pid_alive(pid):
+            return pid
         return None
 
     def save_server_pid(self, server_num: int, pid: int):
         """Save server PID to file."""
-        pid_file = self.logs_dir / f"server{server_num}.pid"
+        pid_file = self.servers[server_num]["pid_file"]
         pid_file.write_text(str(pid))
 
     def get_server_status(self) -> Dict[int, Dict]:
         """Get status of all servers."""
         status = {}
+        # Take one snapshot of listening ports for the whole table
+        listen_ports = self._get_listen_ports()
         for server_num, config in self.servers.items():
             port = config["port"]
             pid = self.get_server_pid(server_num)
@@ -118,12 +571,71 @@ class TestManager:
                 "name": config["name"],
                 "port": port,
                 "pid": pid,
-                "running": self.is_port_in_use(port),
+                "running": port in listen_ports,
                 "config": config["config"],
             }
 
         return status
 
+    def _server_env(self, server_num: int) -> Dict[str, str]:
+        """Build the environment for a server process."""
+        config = self.servers[server_num]
+        return {
+            **os.environ,
+            "CONFIG_FILE": config["config_path"],
+            "PRIVATE_KEY_FILE": config["key_path"],
+            "HOST": "127.0.0.1",
+            "PORT": str(config["port"]),
+        }
+
+    def _start_background(self, server_num: int) -> subprocess.Popen:
+        """Spawn a detached server process that logs to its log file."""
+        log_file = self.servers[server_num]["log_file"]
+        with open(log_file, "w") as f:
+            return subprocess.Popen(
+                self._server_command(),
+                cwd=self.server_dir,
+                env=self._server_env(server_num),
+                stdout=f,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,
+            )
+
+    def _finish_background_launch(
+        self, server_num: int, process: subprocess.Popen, started: bool
+    ) -> bool:
+        """Record the PID of a started background server and report the outcome."""
+        if started:
+            self.save_server_pid(server_num, process.pid)
+            self.console.print(
+                f"  Server {server_num} started (PID: {process.pid})",
+                style="green",
+            )
+            return True
+
+        self.console.print(f"Server {server_num} failed to start", style="red")
+        return False
+
+    def _wait_for_listen(
+        self,
+        port: int,
+        process: subprocess.Popen,
+        timeout: float = SERVER_START_TIMEOUT,
+    ) -> bool:
+        """Poll until a port is listening, backing off between checks.
+
+        Gives up early if the process exits before it starts listening.
+        """
+        deadline = time.monotonic() + timeout
+        delay = LISTEN_POLL_INITIAL
+        while True:
+            if port in self._get_listen_ports():
+                return True
+            if process.poll() is not None or time.monotonic() >= deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 1.5, LISTEN_POLL_MAX)
+
     def launch_server(self, server_num: int, background: bool = False) -> bool:
         """Launch a specific server."""
         if server_num not in self.servers:
@@ -141,20 +653,8 @@ class TestManager:
             )
             return True
 
-        # Set up environment
-        env = os.environ.copy()
-        env.update(
-            {
-                "CONFIG_FILE": str(self.configs_dir / config["config"]),
-                "PRIVATE_KEY_FILE": str(
-                    self.keys_dir / f"server{server_num}_private_key.pem"
-                ),
-                "HOST": "127.0.0.1",
-                "PORT": str(port),
-            }
-        )
-
-        log_file = self.logs_dir / f"server{server_num}.log"
+        env = self._server_env(server_num)
+        log_file = config["log_file"]
 
         self.console.print(
             f"Starting Server {server_num} ({config['name']}) on port {port}..."
@@ -163,60 +663,38 @@ class TestManager:
         try:
             if background:
                 # Start in background
-                with open(log_file, "w") as f:
-                    process = subprocess.Popen(
-                        ["cargo", "run"],
-                        cwd=self.server_dir,
-                        env=env,
-                        stdout=f,
-                        stderr=subprocess.STDOUT,
-                        start_new_session=True,
-                    )
+                process = self._start_background(server_num)
 
-                # Wait a moment and check if it started successfully
+                # Wait for the server to start listening
                 # NOTE: might need adjusting if server is failing to start
-                time.sleep(5)
-                if self.is_port_in_use(port):
-                    self.save_server_pid(server_num, process.pid)
-                    self.console.print(
-                        f"  Server {server_num} started (PID: {process.pid})",
-                        style="green",
-                    )
-                    return True
-                else:
-                    self.console.print(
-                        f"Server {server_num} failed to start", style="red"
-                    )
-                    return False
+                return self._finish_background_launch(
+                    server_num, process, self._wait_for_listen(port, process)
+                )
             else:
                 # Start in foreground with live output
-                with open(log_file, "w") as f:
+                with open(log_file, "w+b") as f:
                     process = subprocess.Popen(
-                        ["cargo", "run"],
+                        self._server_command(),
                         cwd=self.server_dir,
                         env=env,
                         stdout=subprocess.PIPE,
                         stderr=subprocess.STDOUT,
-                        text=True,
-                        bufsize=1,
                     )
 
-                # Stream output to both console and log file
-                try:
-                    if process.stdout is None:
+                    # Stream output to both console and log file
+                    try:
+                        if process.stdout is None:
+                            self.console.print(
+                                "Failed to capture server output", style="red"
+                            )
+                            return process.returncode == 0
+                        _stream_output(process.stdout, f)
+                        process.wait()
+                    except KeyboardInterrupt:
+                        process.terminate()
                         self.console.print(
-                            "Failed to capture server output", style="red"
+                            f"\n  Server {server_num} stopped", style="yellow"
                         )
-                        return process.returncode == 0
-                    for line in process.stdout:
-                        print(line, end="")
-                        f.write(line)
-                        f.flush()
-                except KeyboardInterrupt:
-                    process.terminate()
-                    self.console.print(
-                        f"\n  Server {server_num} stopped", style="yellow"
-                    )
 
                 return process.returncode == 0
 
@@ -237,40 +715,35 @@ class TestManager:
         pid = self.get_server_pid(server_num)
         if pid:
             try:
-                process = psutil.Process(pid)
-                process.terminate()
-
-                # Wait for graceful shutdown
-                try:
-                    process.wait(timeout=5)
-                except psutil.TimeoutExpired:
-                    process.kill()
+                _terminate(pid)
 
                 # Remove PID file
-                pid_file = self.logs_dir / f"server{server_num}.pid"
-                if pid_file.exists():
-                    pid_file.unlink()
+                config["pid_file"].unlink(missing_ok=True)
 
                 self.console.print(
                     f"  Server {server_num} stopped (PID: {pid})", style="green"
                 )
                 return True
 
-            except psutil.NoSuchProcess:
+            except ProcessLookupError:
                 pass
 
-        # Fallback: kill by port
-        for conn in psutil.net_connections():
-            if conn.laddr.port == port and conn.status == psutil.CONN_LISTEN:
-                try:
-                    process = psutil.Process(conn.pid)
-                    process.terminate()
-                    self.console.print(
-                        f"  Server {server_num} stopped (port {port})", style="green"
-                    )
-                    return True
-                except psutil.NoSuchProcess:
-                    pass
+        # Fallback: kill by port, skipping the owner lookup if nothing listens
+        pid = None
+        if self.is_port_in_use(port):
+            if sys.platform == "linux":
+                pid = self._port_owner().get(port)
+            else:
+                pid = self._snapshot_conns().get(port)
+        if pid:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                self.console.print(
+                    f"  Server {server_num} stopped (port {port})", style="green"
+                )
+                return True
+            except ProcessLookupError:
+                pass
 
         self.console.print(f"  Server {server_num} was not running", style="yellow")
         return True
@@ -284,38 +757,77 @@ class TestManager:
             if self.stop_server(server_num):
                 stopped += 1
 
-        # Also kill any remaining cargo processes
-        for proc in psutil.process_iter(["pid", "name", "cmdline"]):
-            try:
-                if "cargo" in proc.name() and "run" in proc.cmdline():
-                    proc.terminate()
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+        # Also kill any remaining cargo or server binary processes
+        server_bin = self._get_server_bin()
+        if sys.platform == "linux":
+            for pid in _iter_server_pids(server_bin):
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except (ProcessLookupError, PermissionError):
+                    pass
+        else:
+            import psutil
+
+            for proc in psutil.process_iter(["pid", "name", "cmdline"]):
+                try:
+                    if ("cargo" in proc.name() and "run" in proc.cmdline()) or (
+                        proc.name() == server_bin.name and proc.exe() == str(server_bin)
+                    ):
+                        proc.terminate()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
 
         self.console.print(f"Stopped {stopped} servers", style="green")
 
     def launch_all_servers(self, delay: int = 5) -> bool:
-        """Launch all servers in sequence."""
+        """Launch all servers, each once the servers it bootstraps from are up.
+
+        Servers whose bootstrap servers are all listening are started together.
+        """
         self.console.print("Launching all test servers...", style="blue")
 
         # Stop any existing servers first
         self.stop_all_servers()
         time.sleep(1)
 
-        success_count = 0
+        managed_ports = {config["port"] for config in self.servers.values()}
+        depends_on = {
+            server_num: _bootstrap_ports(config["config_path"]) & managed_ports
+            for server_num, config in self.servers.items()
+        }
+
+        started_ports = set()
+        pending = sorted(self.servers.keys())
 
-        for server_num in sorted(self.servers.keys()):
-            if self.launch_server(server_num, background=True):
-                success_count += 1
-                if server_num < max(self.servers.keys()):
+        with concurrent.futures.ThreadPoolExecutor() as pool:
+            while pending:
+                ready = [n for n in pending if depends_on[n] <= started_ports]
+                if not ready:
+                    break
+                if started_ports and delay:
                     self.console.print(
-                        f"  Waiting {delay}s before starting next server..."
+                        f"  Waiting {delay}s before starting next servers..."
                     )
                     time.sleep(delay)
-            else:
-                self.console.print(f"Failed to start Server {server_num}", style="red")
-                break
 
+                # Each launch waits in its own thread so their startups overlap
+                results = pool.map(
+                    lambda server_num: self.launch_server(server_num, True), ready
+                )
+                for server_num, started in zip(ready, results):
+                    if started:
+                        started_ports.add(self.servers[server_num]["port"])
+                pending = [n for n in pending if n not in ready]
+
+        for server_num in pending:
+            self.console.print(
+                f"Not starting Server {server_num}: its bootstrap servers are not up",
+                style="red",
+            )
+
+        success_count = sum(
+            config["port"] in started_ports for config in self.servers.values()
+        )
         self.console.print(
             f"Successfully started {success_count}/{len(self.servers)} servers",
             style="green",
@@ -326,6 +838,31 @@ class TestManager:
         """Show status of all servers."""
         status = self.get_server_status()
 
+        if self.plain:
+            rows = [("Server", "Name", "Port", "Status", "PID", "Config")]
+            for server_num, info in status.items():
+                rows.append(
+                    (
+                        f"Server {server_num}",
+                        info["name"],
+                        str(info["port"]),
+                        "Running" if info["running"] else "Stopped",
+                        str(info["pid"]) if info["pid"] else "-",
+                        info["config"],
+                    )
+                )
+            widths = [max(len(row[i]) for row in rows) + 2 for i in range(len(rows[0]))]
+            print("Server Status")
+            for row in rows:
+                print(
+                    "".join(
+                        cell.ljust(width) for cell, width in zip(row, widths)
+                    ).rstrip()
+                )
+            return
+
+        from rich.table import Table
+
         table = Table(title="Server Status")
         table.add_column("Server", style="cyan")
         table.add_column("Name", style="blue")
@@ -355,7 +892,7 @@ class TestManager:
             self.console.print(f"Invalid server number: {server_num}", style="red")
             return
 
-        log_file = self.logs_dir / f"server{server_num}.log"
+        log_file = self.servers[server_num]["log_file"]
 
         if not log_file.exists():
             self.console.print(
@@ -372,15 +909,16 @@ class TestManager:
         else:
             # Show last N lines
             try:
-                result = subprocess.run(
-                    ["tail", "-n", str(lines), str(log_file)],
-                    capture_output=True,
-                    text=True,
-                )
+                output = _tail(log_file, lines)
+
+                if output and self.plain:
+                    print(f"Server {server_num} Logs (last {lines} lines)")
+                    print(output)
+                elif output:
+                    from rich.panel import Panel
 
-                if result.stdout:
                     panel = Panel(
-                        result.stdout,
+                        output,
                         title=f"Server {server_num} Logs (last {lines} lines)",
                         border_style="blue",
                     )
@@ -449,10 +987,71 @@ class TestManager:
         return True
 
 
-def main():
-    """Main CLI entry point."""
-    manager = TestManager()
+# Available commands and their help text, in the order shown by --help
+COMMANDS = {
+    "status": "Show server status",
+    "build": "Build the server",
+    "start": "Start a specific server",
+    "start-all": "Start all servers",
+    "stop": "Stop a specific server",
+    "stop-all": "Stop all servers",
+    "logs": "Show server logs",
+    "demo": "Run bootstrap demonstration",
+    "generate-keys": "Generate new RSA keys",
+}
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for integers of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def _add_command_arguments(command: str, parser: argparse.ArgumentParser):
+    """Add the arguments specific to a command to its subparser."""
+    if command == "start":
+        parser.add_argument(
+            "server", type=int, choices=[1, 2, 3], help="Server number to start"
+        )
+        parser.add_argument(
+            "--background", "-b", action="store_true", help="Start in background"
+        )
+
+    elif command == "start-all":
+        parser.add_argument(
+            "--delay",
+            "-d",
+            type=int,
+            default=3,
+            help="Delay between dependent server starts (seconds)",
+        )
+
+    elif command == "stop":
+        parser.add_argument(
+            "server", type=int, choices=[1, 2, 3], help="Server number to stop"
+        )
+
+    elif command == "logs":
+        parser.add_argument("server", type=int, choices=[1, 2, 3], help="Server number")
+        parser.add_argument(
+            "--follow", "-f", action="store_true", help="Follow log output"
+        )
+        parser.add_argument(
+            "--lines",
+            "-n",
+            type=_positive_int,
+            default=20,
+            help="Number of lines to show",
+        )
 
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    If a command is given, only that command's subparser is constructed.
+    """
     parser = argparse.ArgumentParser(
         description="Secure Chat Protocol - Testing CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -470,59 +1069,28 @@ Examples:
         """,
     )
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # Status command
-    subparsers.add_parser("status", help="Show server status")
-
-    # Build command
-    subparsers.add_parser("build", help="Build the server")
-
-    # Start command
-    start_parser = subparsers.add_parser("start", help="Start a specific server")
-    start_parser.add_argument(
-        "server", type=int, choices=[1, 2, 3], help="Server number to start"
-    )
-    start_parser.add_argument(
-        "--background", "-b", action="store_true", help="Start in background"
-    )
-
-    # Start all command
-    start_all_parser = subparsers.add_parser("start-all", help="Start all servers")
-    start_all_parser.add_argument(
-        "--delay",
-        "-d",
-        type=int,
-        default=3,
-        help="Delay between server starts (seconds)",
+    # Options shared by every command
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--plain",
+        action="store_true",
+        help="Print unstyled output (default when stdout is not a terminal)",
     )
 
-    # Stop command
-    stop_parser = subparsers.add_parser("stop", help="Stop a specific server")
-    stop_parser.add_argument(
-        "server", type=int, choices=[1, 2, 3], help="Server number to stop"
-    )
-
-    # Stop all command
-    subparsers.add_parser("stop-all", help="Stop all servers")
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    for name, help_text in COMMANDS.items():
+        if command is None or name == command:
+            subparser = subparsers.add_parser(name, help=help_text, parents=[common])
+            _add_command_arguments(name, subparser)
 
-    # Logs command
-    logs_parser = subparsers.add_parser("logs", help="Show server logs")
-    logs_parser.add_argument(
-        "server", type=int, choices=[1, 2, 3], help="Server number"
-    )
-    logs_parser.add_argument(
-        "--follow", "-f", action="store_true", help="Follow log output"
-    )
-    logs_parser.add_argument(
-        "--lines", "-n", type=int, default=20, help="Number of lines to show"
-    )
+    return parser
 
-    # Demo command
-    subparsers.add_parser("demo", help="Run bootstrap demonstration")
 
-    # Generate keys command
-    subparsers.add_parser("generate-keys", help="Generate new RSA keys")
+def main():
+    """Main CLI entry point."""
+    # Only build the full parser for --help, no command or unknown commands
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    parser = build_parser(command if command in COMMANDS else None)
 
     args = parser.parse_args()
 
@@ -530,6 +1098,8 @@ Examples:
         parser.print_help()
         return
 
+    manager = TestManager(plain=args.plain or not sys.stdout.isatty())
+
     try:
         if args.command == "status":
             manager.show_status()
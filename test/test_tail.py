@@ -0,0 +1,33 @@
+# GROUP: 42
+# MEMBERS: Ray Okamoto, Phoenix Pereira, Kayla Rowley, Qi Wu, Ho Yin Li
+"""Regression tests for log tailing in the Testing CLI."""
+
+import argparse
+
+import pytest
+
+from test_cli import _positive_int, _tail, build_parser
+
+
+def test_tail_returns_last_lines(tmp_path):
+    log = tmp_path / "server.log"
+    log.write_bytes(b"".join(b"line %d\n" % i for i in range(100)))
+
+    assert _tail(log, 3) == "line 97\nline 98\nline 99"
+
+
+@pytest.mark.parametrize("n", [0, -1, -5])
+def test_tail_non_positive_returns_empty(tmp_path, n):
+    log = tmp_path / "server.log"
+    log.write_bytes(b"a\nb\nc\n")
+
+    assert _tail(log, n) == ""
+
+
+@pytest.mark.parametrize("value", ["0", "-3"])
+def test_lines_rejects_non_positive(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        _positive_int(value)
+
+    with pytest.raises(SystemExit):
+        build_parser("logs").parse_args(["logs", "1", "--lines", value])